@@ -1,6 +1,5 @@
 """Batch processing utility for efficient data handling."""
 
-import json
 import logging
 from typing import Generic, Iterator, Optional, Sequence, TypeVar
 
@@ -88,11 +87,20 @@ class DocumentBatchProcessor:
             yield batch
 
 
+# The API client encodes request bodies with json.dumps, which writes DEL and
+# every non-ASCII character as a six-character \uXXXX escape (astral characters
+# as a surrogate pair of them); pydantic's JSON leaves them raw. In UTF-8 each
+# such character has exactly one byte that survives deleting these tables.
+_NON_ESCAPE_START_BYTES = bytes(range(0x7F)) + bytes(range(0x80, 0xC0))
+_NON_ASTRAL_START_BYTES = bytes(range(0xF0))
+
+
 def _document_size_bytes(document: DocumentDefinition) -> int:
-    """Return the UTF-8 byte size of a serialized document."""
-    return len(
-        json.dumps(
-            document.model_dump(by_alias=True, exclude_none=True),
-            separators=(",", ":"),
-        ).encode("utf-8")
-    )
+    """Return the byte size of a document as the API client serializes it."""
+    serialized = document.model_dump_json(by_alias=True, exclude_none=True)
+    if serialized.isascii():
+        return len(serialized) + 5 * serialized.count("\x7f")
+    encoded = serialized.encode("utf-8", "surrogatepass")
+    escaped = len(encoded.translate(None, _NON_ESCAPE_START_BYTES))
+    astral = len(encoded.translate(None, _NON_ASTRAL_START_BYTES))
+    return len(serialized) + 5 * escaped + 6 * astral
@@ -21,6 +21,7 @@ class ConnectorMetrics:
         self.logger = logger or logging.getLogger(__name__)
         self.start_time = 0
         self.end_time = 0
+        self._perf_start = 0.0
         self.stats: Dict[str, Any] = {}
 
     def __enter__(self) -> "ConnectorMetrics":
@@ -30,13 +31,14 @@ class ConnectorMetrics:
             The ConnectorMetrics instance.
         """
         self.start_time = time.time()
+        self._perf_start = time.perf_counter()
         self.logger.info(f"Starting {self.name}")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit the context manager, stopping the timer and logging metrics."""
         self.end_time = time.time()
-        duration = self.end_time - self.start_time
+        duration = time.perf_counter() - self._perf_start
         self.stats["duration"] = duration
         self.logger.info(f"Completed {self.name} in {duration:.2f} seconds")
 
@@ -1,9 +1,11 @@
 """Base async streaming datasource connector for memory-efficient processing of large datasets."""
 
 import asyncio
+import contextvars
 import logging
 import uuid
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncGenerator, List, Optional, Sequence
 
 from glean.api_client.models import DocumentDefinition
@@ -33,6 +35,10 @@ class BaseAsyncStreamingDatasourceConnector(BaseDatasourceConnector[TSourceData]
         - async_data_client: BaseAsyncStreamingDataClient (set in __init__)
         - transform(self, data: Sequence[TSourceData]) -> Sequence[DocumentDefinition]
 
+    transform() stays synchronous; it is called on a dedicated worker thread so
+    that a CPU-bound transform does not stall the event loop. It therefore
+    cannot use the running loop or loop-bound clients.
+
     Attributes:
         name (str): The unique name of the connector (should be snake_case).
         configuration (CustomDatasourceConfig): The datasource configuration.
@@ -118,17 +124,35 @@ class BaseAsyncStreamingDatasourceConnector(BaseDatasourceConnector[TSourceData]
             upload_max_workers=upload_max_workers,
         )
 
+        # transform() is synchronous and often CPU-bound, so it runs off the loop
+        # thread. While it runs the loop keeps serving in-flight uploads. It gets
+        # its own thread so it never queues behind uploads on the default executor.
+        # Each call runs in a copy of the caller's context, as asyncio.to_thread does.
+        loop = asyncio.get_running_loop()
+        transform_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{self.name}-transform"
+        )
+
+        def transform_in_context(
+            context: contextvars.Context, batch: List[TSourceData]
+        ) -> Sequence[DocumentDefinition]:
+            return context.run(self.transform, batch)
+
         try:
 
             async def transformed_batches() -> AsyncGenerator[Sequence[DocumentDefinition], None]:
                 nonlocal batch_count
+                # Resolved once; this loop runs per item, not per batch.
+                batch_size = self.batch_size
                 batch: List[TSourceData] = []
                 async for item in self.get_data_async(since=since):
                     batch.append(item)
-                    if len(batch) < self.batch_size:
+                    if len(batch) < batch_size:
                         continue
                     logger.info(f"Processing batch {batch_count} with {len(batch)} items")
-                    transformed_batch = self.transform(batch)
+                    transformed_batch = await loop.run_in_executor(
+                        transform_executor, transform_in_context, contextvars.copy_context(), batch
+                    )
                     logger.info(
                         f"Transformed batch {batch_count}: {len(transformed_batch)} documents"
                     )
@@ -137,7 +161,9 @@ class BaseAsyncStreamingDatasourceConnector(BaseDatasourceConnector[TSourceData]
                     batch = []
                 if batch:
                     logger.info(f"Processing batch {batch_count} with {len(batch)} items")
-                    transformed_batch = self.transform(batch)
+                    transformed_batch = await loop.run_in_executor(
+                        transform_executor, transform_in_context, contextvars.copy_context(), batch
+                    )
                     logger.info(
                         f"Transformed batch {batch_count}: {len(transformed_batch)} documents"
                     )
@@ -242,6 +268,8 @@ class BaseAsyncStreamingDatasourceConnector(BaseDatasourceConnector[TSourceData]
         except Exception as e:
             logger.exception(f"Error during async streaming indexing: {e}")
             raise
+        finally:
+            transform_executor.shutdown(wait=False, cancel_futures=True)
 
     def get_data(self, since: Optional[str] = None) -> Sequence[TSourceData]:
         """
@@ -134,20 +134,17 @@ class BaseDatasourceConnector(BaseConnector[TSourceData, DocumentDefinition], AB
 
             logger.info("Starting identity crawl")
             identities = self.get_identities()
+            identity_uploader = PushUploader(datasource=self.name)
 
             users = identities.get("users")
             if users:
                 logger.info(f"Indexing {len(users)} users")
-                PushUploader(datasource=self.name).bulk_index_users(
-                    users=users, batch_size=self.batch_size
-                )
+                identity_uploader.bulk_index_users(users=users, batch_size=self.batch_size)
 
             groups = identities.get("groups")
             if groups:
                 logger.info(f"Indexing {len(groups)} groups")
-                PushUploader(datasource=self.name).bulk_index_groups(
-                    groups=groups, batch_size=self.batch_size
-                )
+                identity_uploader.bulk_index_groups(groups=groups, batch_size=self.batch_size)
 
                 memberships = identities.get("memberships")
                 if not memberships:
@@ -159,7 +156,7 @@ class BaseDatasourceConnector(BaseConnector[TSourceData, DocumentDefinition], AB
                     )
 
                 logger.info(f"Indexing {len(memberships)} memberships")
-                PushUploader(datasource=self.name).bulk_index_memberships(
+                identity_uploader.bulk_index_memberships(
                     memberships=memberships, batch_size=self.batch_size
                 )
 
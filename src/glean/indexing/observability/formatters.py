@@ -10,6 +10,9 @@ import traceback
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+# Attribute names every LogRecord carries, computed once for the package.
+_STANDARD_LOG_RECORD_ATTRS: frozenset = frozenset(logging.makeLogRecord({}).__dict__)
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -39,7 +42,7 @@ class StructuredFormatter(logging.Formatter):
          "batch_id": "123", "count": 50}
     """
 
-    _STANDARD_LOG_RECORD_ATTRS: frozenset = frozenset(logging.makeLogRecord({}).__dict__)
+    _STANDARD_LOG_RECORD_ATTRS: frozenset = _STANDARD_LOG_RECORD_ATTRS
 
     def __init__(
         self,
@@ -71,6 +74,15 @@ class StructuredFormatter(logging.Formatter):
         self.message_field = message_field
         self.exception_field = exception_field
         self.extra_fields = extra_fields or {}
+        # Record attributes that never pass through as extras, computed once
+        # rather than per record.
+        self._excluded_record_attrs: frozenset = self._STANDARD_LOG_RECORD_ATTRS | {
+            timestamp_field,
+            level_field,
+            logger_field,
+            message_field,
+            exception_field,
+        }
 
     def _build_log_data(self, record: logging.LogRecord) -> Dict[str, Any]:
         log_data: Dict[str, Any] = {}
@@ -87,19 +99,9 @@ class StructuredFormatter(logging.Formatter):
         log_data[self.logger_field] = record.name
         log_data[self.message_field] = record.getMessage()
 
-        reserved_output_fields = {
-            self.timestamp_field,
-            self.level_field,
-            self.logger_field,
-            self.message_field,
-            self.exception_field,
-        }
+        excluded = self._excluded_record_attrs
         for key, value in record.__dict__.items():
-            if (
-                key not in self._STANDARD_LOG_RECORD_ATTRS
-                and key not in reserved_output_fields
-                and not key.startswith("_")
-            ):
+            if key not in excluded and not key.startswith("_"):
                 log_data[key] = value
 
         exc_info = record.exc_info
@@ -107,7 +109,7 @@ class StructuredFormatter(logging.Formatter):
             log_data[self.exception_field] = {
                 "type": exc_info[0].__name__,
                 "message": str(exc_info[1]) if exc_info[1] else None,
-                "traceback": self._format_exception(exc_info),
+                "traceback": self._cached_traceback(record, exc_info),
             }
 
         return log_data
@@ -127,14 +129,19 @@ class StructuredFormatter(logging.Formatter):
                 }
             )
 
-    def _format_exception(self, exc_info) -> str:
-        if not exc_info:
-            return ""
-
+    def _cached_traceback(self, record: logging.LogRecord, exc_info) -> str:
+        # Cached on the record, as logging.Formatter does, so a record handled
+        # by several handlers has its stack formatted only once.
+        # Only a successfully formatted stack is cached: exc_text is shared
+        # with every other formatter, so the str() fallback must not leak there.
+        if record.exc_text:
+            return record.exc_text
         try:
-            return "".join(traceback.format_exception(*exc_info)).strip()
+            formatted = "".join(traceback.format_exception(*exc_info)).strip()
         except Exception:
             return str(exc_info)
+        record.exc_text = formatted
+        return formatted
 
 
 class CompactStructuredFormatter(StructuredFormatter):
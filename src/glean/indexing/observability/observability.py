@@ -8,7 +8,7 @@ import uuid
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
 
-from .formatters import StructuredFormatter
+from .formatters import _STANDARD_LOG_RECORD_ATTRS, StructuredFormatter
 from .logging import LoggerProvider
 from .providers import MetricsProvider, MetricType, NoOpMetricsProvider
 
@@ -40,6 +40,7 @@ class ConnectorObservability:
         self.metrics: Dict[str, Any] = defaultdict(int)
         self.timers: Dict[str, float] = {}
         self.start_time: Optional[float] = None
+        self._perf_start: float = 0.0
         self._execution_failed: bool = False
 
     def get_common_fields(self, operation: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
@@ -52,9 +53,7 @@ class ConnectorObservability:
         Raises:
             ValueError: If kwargs contains reserved LogRecord attribute names
         """
-        reserved_attrs = set(logging.makeLogRecord({}).__dict__)
-
-        conflicting_keys = set(kwargs.keys()) & reserved_attrs
+        conflicting_keys = kwargs.keys() & _STANDARD_LOG_RECORD_ATTRS
         if conflicting_keys:
             raise ValueError(
                 f"Cannot use reserved LogRecord attribute names in extra fields: {conflicting_keys}. "
@@ -87,6 +86,7 @@ class ConnectorObservability:
     def start_execution(self) -> None:
         """Mark the start of connector execution."""
         self.start_time = time.time()
+        self._perf_start = time.perf_counter()
         self._execution_failed = False
         logger.info(
             "Crawl started",
@@ -114,7 +114,7 @@ class ConnectorObservability:
             self.fail_execution(cast(Exception, exc_info[1]))
             return
 
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self._perf_start
         duration_ms = int(duration * 1000)
         self.metrics["total_execution_time"] = duration
         self.start_time = None
@@ -146,7 +146,7 @@ class ConnectorObservability:
         self._execution_failed = True
         duration_ms = None
         if self.start_time:
-            duration = time.time() - self.start_time
+            duration = time.perf_counter() - self._perf_start
             duration_ms = int(duration * 1000)
             self.metrics["total_execution_time"] = duration
             self.start_time = None
@@ -185,12 +185,12 @@ class ConnectorObservability:
 
     def start_timer(self, operation: str):
         """Start timing an operation."""
-        self.timers[operation] = time.time()
+        self.timers[operation] = time.perf_counter()
 
     def end_timer(self, operation: str):
         """End timing an operation and record the duration."""
         if operation in self.timers:
-            duration = time.time() - self.timers[operation]
+            duration = time.perf_counter() - self.timers[operation]
             self.record_metric(f"{operation}_duration", duration)
             del self.timers[operation]
             return duration
@@ -551,11 +551,11 @@ def with_observability(
                 else:
                     logger.info(f"[{class_name}] {method_name} started")
 
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 try:
                     result = method(self, *args, **kwargs)
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
 
                     if include_return:
                         logger.info(
@@ -570,7 +570,7 @@ def with_observability(
                     return result
 
                 except Exception as e:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     logger.error(f"[{class_name}] {method_name} failed after {duration:.3f}s: {e}")
 
                     if hasattr(self, "_observability"):
@@ -621,15 +621,17 @@ class PerformanceTracker:
         self.operation_name = operation_name
         self.observability = observability
         self.start_time: Optional[float] = None
+        self._perf_start: Optional[float] = None
 
     def __enter__(self):
         self.start_time = time.time()
+        self._perf_start = time.perf_counter()
         logger.info(f"Starting operation: {self.operation_name}")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self._perf_start is not None:
+            duration = time.perf_counter() - self._perf_start
 
             if exc_type is None:
                 logger.info(f"Operation '{self.operation_name}' completed in {duration:.3f}s")
@@ -653,11 +655,12 @@ class ProgressCallback:
         self.total_items = total_items
         self.processed_items = 0
         self.start_time = time.time()
+        self._perf_start = time.perf_counter()
 
     def update(self, items_processed: int):
         """Update progress with number of items processed."""
         self.processed_items += items_processed
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self._perf_start
 
         if self.total_items:
             progress_pct = (self.processed_items / self.total_items) * 100
@@ -673,7 +676,7 @@ class ProgressCallback:
 
     def complete(self):
         """Mark progress as complete."""
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self._perf_start
         logger.info(
             f"Processing complete: {self.processed_items} items in {elapsed:.2f}s "
             f"(avg rate: {self.processed_items / elapsed:.1f} items/sec)"
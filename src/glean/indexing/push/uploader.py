@@ -157,7 +157,7 @@ class PushUploader:
         """Add or update multiple documents using `/indexdocuments`."""
         document_list = list(documents)
         document_ids = [document.id for document in document_list if document.id]
-        start_time = time.time()
+        start_time = time.perf_counter()
         if self.observability:
             self.observability.log_document_upload_started(document_ids, upload_id=upload_id)
         with api_client() as client:
@@ -313,7 +313,7 @@ class PushUploader:
                 entity_type="document",
             )
             self.observability.record_upload_batch_size(len(document_list))
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             with api_client() as client:
                 self._call_api(
@@ -462,7 +462,7 @@ class PushUploader:
                         entity_type="user",
                     )
                     self.observability.record_upload_batch_size(len(user_batch))
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     self._call_api(
                         "permissions.bulk_index_users",
@@ -550,7 +550,7 @@ class PushUploader:
                         entity_type="group",
                     )
                     self.observability.record_upload_batch_size(len(group_batch))
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     self._call_api(
                         "permissions.bulk_index_groups",
@@ -638,7 +638,7 @@ class PushUploader:
                         entity_type="membership",
                     )
                     self.observability.record_upload_batch_size(len(membership_batch))
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     self._call_api(
                         "permissions.bulk_index_memberships",
@@ -760,7 +760,7 @@ class PushUploader:
                         entity_type="employee",
                     )
                     self.observability.record_upload_batch_size(len(employee_batch))
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     self._call_api(
                         "people.bulk_index",
@@ -807,7 +807,7 @@ class PushUploader:
         return list(BatchProcessor(list(items), batch_size=batch_size))
 
     def _call_api(self, endpoint: str, call: Callable[[], Any]) -> Any:
-        start_time = time.time()
+        start_time = time.perf_counter()
         if self.observability:
             self.observability.record_api_request_count(endpoint)
         try:
@@ -824,7 +824,7 @@ class PushUploader:
 
     @staticmethod
     def _elapsed_ms(start_time: float) -> int:
-        return int((time.time() - start_time) * 1000)
+        return int((time.perf_counter() - start_time) * 1000)
 
     def _upload_id(self, upload_id: Optional[str]) -> str:
         return upload_id or str(uuid.uuid4())
@@ -83,7 +83,7 @@ class BasePullHttpStreamingDataClient(BaseStreamingDataClient[TSourceData], Gene
 
     def get_source_data(self, **kwargs: Any) -> Generator[TSourceData, None, None]:
         """Yield source data from the configured HTTP endpoint."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         item_count = 0
         success = False
         if self.observability:
@@ -117,7 +117,7 @@ class BasePullHttpStreamingDataClient(BaseStreamingDataClient[TSourceData], Gene
             if success and self.observability:
                 self.observability.log_data_fetch_completed(
                     item_count=item_count,
-                    duration_ms=int((time.time() - start_time) * 1000),
+                    duration_ms=int((time.perf_counter() - start_time) * 1000),
                     path=self.path,
                     pagination=self.pagination,
                 )
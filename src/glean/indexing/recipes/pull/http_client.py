@@ -197,7 +197,7 @@ class PullHttpClient:
                     url,
                     "***MASKED***" if self.options.mask_params else params,
                 )
-                request_start = time.time()
+                request_start = time.perf_counter()
                 self.__record_api_request_count(endpoint)
                 response = self._client.request(
                     method,
@@ -301,7 +301,7 @@ class PullHttpClient:
     def __record_api_request_latency(self, start_time: float, endpoint: str) -> None:
         if self.observability:
             self.observability.record_api_request_latency(
-                (time.time() - start_time) * 1000, endpoint
+                (time.perf_counter() - start_time) * 1000, endpoint
             )
 
     def __record_api_request_error(self, endpoint: str, error_type: str) -> None:
@@ -17,9 +17,12 @@ memory before being flushed to disk).
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import functools
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, AsyncGenerator, Generator, Generic, Optional, Sequence
 
@@ -48,10 +51,26 @@ def _serialise(item: Any) -> str:
 
 def _write_ndjson(path: Path, items: Sequence[Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("\n".join(_serialise(item) for item in items))
+    # Stream line by line so the whole fixture is never built as one string,
+    # into a sibling file that only replaces the fixture once every item has
+    # serialised. A failure part-way leaves the previous recording intact.
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("w") as handle:
+            handle.writelines(f"{_serialise(item)}\n" for item in items)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
+@functools.cache
 def _sdk_version() -> str:
+    """Return the installed SDK version, resolved once per process.
+
+    Package metadata lookups scan ``sys.path``, and the version cannot change
+    while the process runs.
+    """
     try:
         from importlib.metadata import version
 
@@ -219,14 +238,15 @@ class RecordingAsyncStreamingClientWrapper(
         data_path = fixture_dir / _DATA_FILENAME
         manifest_path = fixture_dir / _MANIFEST_FILENAME
 
-        _write_ndjson(data_path, items)
+        # File writes block; keep them off the event loop the crawl runs on.
+        await asyncio.to_thread(_write_ndjson, data_path, items)
         manifest = CacheManifest.create(
             connector=self._connector_name,
             client=self._client_name,
             sdk_version=self._sdk_version,
             item_count=len(items),
         )
-        manifest.save(manifest_path)
+        await asyncio.to_thread(manifest.save, manifest_path)
         logger.debug(
             "Recorded %d items for client '%s' → %s", len(items), self._client_name, data_path
         )
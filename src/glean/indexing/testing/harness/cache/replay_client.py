@@ -20,10 +20,11 @@ An empty or missing NDJSON file raises a clear :class:`FileNotFoundError` or
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Any, AsyncGenerator, Generator, Generic, List, Optional, Sequence
+from typing import Any, AsyncGenerator, Generator, Generic, Iterator, List, Optional, Sequence
 
 from glean.indexing.connectors.base_async_streaming_data_client import BaseAsyncStreamingDataClient
 from glean.indexing.connectors.base_data_client import BaseDataClient
@@ -35,14 +36,19 @@ logger = logging.getLogger(__name__)
 _DATA_FILENAME = "data.ndjson"
 
 
-def _load_ndjson(path: Path) -> List[Any]:
-    """Read and parse an NDJSON file.
+def _iter_ndjson(path: Path, max_items: Optional[int] = None) -> Iterator[Any]:
+    """Lazily parse an NDJSON file, one line at a time.
+
+    Only the items actually consumed are parsed, and the file is never held in
+    memory whole, so replaying a capped or partially consumed fixture stays
+    cheap however large the recording is.
 
     Args:
         path: Path to the NDJSON file.
+        max_items: If set, stop after this many items.
 
-    Returns:
-        List of deserialised items.
+    Yields:
+        Deserialised items, in file order.
 
     Raises:
         FileNotFoundError: If *path* does not exist.
@@ -53,12 +59,38 @@ def _load_ndjson(path: Path) -> List[Any]:
             f"Cache fixture not found: {path}\n"
             "Run the integration test without a cache first to record the fixture."
         )
-    content = path.read_text().strip()
-    if not content:
+    found = False
+    count = 0
+    with path.open() as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            found = True
+            if max_items is not None and count >= max_items:
+                break
+            yield json.loads(line)
+            count += 1
+    if not found:
         raise ValueError(
             f"Cache fixture is empty: {path}\nDelete the fixture directory and re-run to re-record."
         )
-    return [json.loads(line) for line in content.splitlines()]
+
+
+def _load_ndjson(path: Path, max_items: Optional[int] = None) -> List[Any]:
+    """Read and parse an NDJSON file.
+
+    Args:
+        path: Path to the NDJSON file.
+        max_items: If set, read at most this many items.
+
+    Returns:
+        List of deserialised items.
+
+    Raises:
+        FileNotFoundError: If *path* does not exist.
+        ValueError: If *path* exists but is empty.
+    """
+    return list(_iter_ndjson(path, max_items))
 
 
 class ReplayDataClientWrapper(BaseDataClient[TSourceData], Generic[TSourceData]):
@@ -94,9 +126,7 @@ class ReplayDataClientWrapper(BaseDataClient[TSourceData], Generic[TSourceData])
 
     def get_source_data(self, **kwargs: Any) -> Sequence[TSourceData]:
         path = self._data_path()
-        items = _load_ndjson(path)
-        if self._max_items is not None:
-            items = items[: self._max_items]
+        items = _load_ndjson(path, self._max_items)
         logger.debug("Replayed %d items for client '%s' ← %s", len(items), self._client_name, path)
         return items  # type: ignore[return-value]
 
@@ -134,12 +164,11 @@ class ReplayStreamingClientWrapper(BaseStreamingDataClient[TSourceData], Generic
 
     def get_source_data(self, **kwargs: Any) -> Generator[TSourceData, None, None]:
         path = self._data_path()
-        items = _load_ndjson(path)
-        if self._max_items is not None:
-            items = items[: self._max_items]
-        logger.debug("Replayed %d items for client '%s' ← %s", len(items), self._client_name, path)
-        for item in items:
+        count = 0
+        for item in _iter_ndjson(path, self._max_items):
+            count += 1
             yield item  # type: ignore[misc]
+        logger.debug("Replayed %d items for client '%s' ← %s", count, self._client_name, path)
 
 
 class ReplayAsyncStreamingClientWrapper(
@@ -177,9 +206,7 @@ class ReplayAsyncStreamingClientWrapper(
 
     async def get_source_data(self, **kwargs: Any) -> AsyncGenerator[TSourceData, None]:
         path = self._data_path()
-        items = _load_ndjson(path)
-        if self._max_items is not None:
-            items = items[: self._max_items]
+        items = await asyncio.to_thread(_load_ndjson, path, self._max_items)
         logger.debug("Replayed %d items for client '%s' ← %s", len(items), self._client_name, path)
         for item in items:
             yield item  # type: ignore[misc]
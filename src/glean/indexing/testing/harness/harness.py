@@ -38,6 +38,7 @@ from glean.indexing.testing.harness.cache.recording_client import (
     RecordingAsyncStreamingClientWrapper,
     RecordingDataClientWrapper,
     RecordingStreamingClientWrapper,
+    _sdk_version,
 )
 from glean.indexing.testing.harness.cache.replay_client import (
     ReplayAsyncStreamingClientWrapper,
@@ -64,15 +65,6 @@ AnyDataClient = Union[
 _MANIFEST_FILENAME = "manifest.json"
 
 
-def _sdk_version() -> str:
-    try:
-        from importlib.metadata import version
-
-        return version("glean-indexing-sdk")
-    except Exception:
-        return "unknown"
-
-
 def _should_use_cache(
     manifest_path: Path,
     use_cache: bool,
@@ -81,12 +73,11 @@ def _should_use_cache(
     """Return ``True`` if a valid, non-stale cache fixture should be replayed."""
     if not use_cache or refresh_cache:
         return False
-    if not manifest_path.exists():
-        return False
-    # Also require the data file to exist; a manifest without data is a partial write.
+    # Require the data file too; a manifest without data is a partial write.
     data_path = manifest_path.parent / "data.ndjson"
     if not data_path.exists():
         return False
+    # A missing manifest surfaces from the load itself, so it is not stat'ed first.
     try:
         manifest = CacheManifest.load(manifest_path)
     except Exception:
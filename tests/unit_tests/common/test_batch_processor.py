@@ -1,7 +1,10 @@
+import json
+
 import pytest
 
 from glean.api_client.models import ContentDefinition, DocumentDefinition
 from glean.indexing.common import BatchProcessor, DocumentBatchProcessor
+from glean.indexing.common.batch_processor import _document_size_bytes
 
 
 class TestBatchProcessor:
@@ -89,6 +92,25 @@ class TestDocumentBatchProcessor:
         batches = list(processor)
         assert batches == [[large_document], [small_document]]
 
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "hello",
+            "héllo wörld",
+            "emoji \U0001f600",
+            "\u201ccurly\u201d \u2014 dash\u00a0nbsp",
+            "delete \x7f and control \x01",
+        ],
+    )
+    def test_document_size_matches_request_encoding(self, body: str):
+        """Test that document size matches the ASCII-escaped JSON the API client sends."""
+        document = self._document("1", body=body)
+        expected = json.dumps(
+            document.model_dump(by_alias=True, exclude_none=True), separators=(",", ":")
+        )
+
+        assert _document_size_bytes(document) == len(expected.encode("utf-8"))
+
     def test_rejects_invalid_max_batch_bytes(self):
         """Test that invalid byte limits are rejected."""
         with pytest.raises(ValueError, match="max_batch_bytes"):
@@ -2,35 +2,48 @@
 
 import logging
 import time
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from glean.indexing.common import ConnectorMetrics
 
 
 class TestConnectorMetrics:
-    def test_context_manager_timing(self):
-        """Test that the context manager properly times operations."""
-        mock_logger = MagicMock(spec=logging.Logger)
+    @pytest.fixture
+    def mock_logger(self):
+        """Create a logger mock that records metric log calls."""
+        return MagicMock(spec=logging.Logger)
 
+    @patch("glean.indexing.common.metrics.time")
+    def test_context_manager_timing(self, mock_time, mock_logger):
+        """Test that the context manager properly times operations."""
+        mock_time.perf_counter.side_effect = [0.0, 0.25]
         with ConnectorMetrics("test_operation", logger=mock_logger) as metrics:
-            time.sleep(0.1)
+            pass
 
         mock_logger.info.assert_any_call("Starting test_operation")
 
-        completion_calls = [
-            call
+        completion_count = sum(
+            1
             for call in mock_logger.info.call_args_list
-            if "Completed test_operation in" in call[0][0]
-        ]
-        assert len(completion_calls) == 1
+            if "Completed test_operation in" in call.args[0]
+        )
+        assert completion_count == 1
 
-        assert "duration" in metrics.stats
-        assert metrics.stats["duration"] > 0
+        assert metrics.stats["duration"] == pytest.approx(0.25)
 
-    def test_record_metrics(self):
-        """Test recording custom metrics."""
-        mock_logger = MagicMock(spec=logging.Logger)
+    def test_start_and_end_times_are_wall_clock(self, mock_logger):
+        """Test that the public timestamps are epoch seconds, not a process-local clock."""
+        before = time.time()
+        with ConnectorMetrics("test_timestamps", logger=mock_logger) as metrics:
+            pass
+        after = time.time()
+
+        assert before <= metrics.start_time <= metrics.end_time <= after
 
+    def test_record_metrics(self, mock_logger):
+        """Test recording custom metrics."""
         with ConnectorMetrics("test_metrics", logger=mock_logger) as metrics:
             metrics.record("count", 42)
             metrics.record("status", "success")
@@ -41,26 +54,24 @@ class TestConnectorMetrics:
         mock_logger.debug.assert_any_call("Recorded metric count=42 for test_metrics")
         mock_logger.debug.assert_any_call("Recorded metric status=success for test_metrics")
 
-        final_stats_calls = [
-            call
+        final_stats_count = sum(
+            1
             for call in mock_logger.info.call_args_list
-            if "Metrics for test_metrics:" in call[0][0]
-        ]
-        assert len(final_stats_calls) == 1
+            if "Metrics for test_metrics:" in call.args[0]
+        )
+        assert final_stats_count == 1
 
-    def test_exception_handling(self):
+    def test_exception_handling(self, mock_logger):
         """Test that metrics work even when exceptions occur."""
-        mock_logger = MagicMock(spec=logging.Logger)
-
         try:
             with ConnectorMetrics("test_exception", logger=mock_logger):
                 raise ValueError("Test exception")
         except ValueError:
             pass
 
-        completion_calls = [
-            call
+        completion_count = sum(
+            1
             for call in mock_logger.info.call_args_list
-            if "Completed test_exception in" in call[0][0]
-        ]
-        assert len(completion_calls) == 1
+            if "Completed test_exception in" in call.args[0]
+        )
+        assert completion_count == 1
@@ -3,8 +3,10 @@
 import json
 import logging
 import sys
+import traceback
 from datetime import datetime
 from io import StringIO
+from unittest.mock import patch
 
 from glean.indexing.observability import (
     CompactStructuredFormatter,
@@ -168,6 +170,56 @@ class TestStructuredFormatter:
             assert "traceback" in log_data["exception"]
             assert "ValueError: Test error" in log_data["exception"]["traceback"]
 
+    def test_exception_traceback_formatted_once_per_record(self):
+        """Test a record shared by several handlers formats its traceback once."""
+        try:
+            raise ValueError("Test error")
+        except ValueError:
+            record = logging.LogRecord(
+                name="test",
+                level=logging.ERROR,
+                pathname="test.py",
+                lineno=10,
+                msg="Error occurred",
+                args=(),
+                exc_info=sys.exc_info(),
+            )
+
+        with patch(
+            "glean.indexing.observability.formatters.traceback.format_exception",
+            wraps=traceback.format_exception,
+        ) as format_exception:
+            first = json.loads(StructuredFormatter().format(record))
+            second = json.loads(CompactStructuredFormatter().format(record))
+
+        assert format_exception.call_count == 1
+        assert first["exception"]["traceback"] == second["exception"]["traceback"]
+
+    def test_traceback_fallback_not_cached_on_record(self):
+        """Test a traceback that fails to format does not leak into exc_text."""
+        try:
+            raise ValueError("Test error")
+        except ValueError:
+            record = logging.LogRecord(
+                name="test",
+                level=logging.ERROR,
+                pathname="test.py",
+                lineno=10,
+                msg="Error occurred",
+                args=(),
+                exc_info=sys.exc_info(),
+            )
+
+        with patch(
+            "glean.indexing.observability.formatters.traceback.format_exception",
+            side_effect=RuntimeError("boom"),
+        ):
+            log_data = json.loads(StructuredFormatter().format(record))
+
+        assert log_data["exception"]["traceback"] == str(record.exc_info)
+        assert record.exc_text is None
+        assert "ValueError: Test error" in logging.Formatter().format(record)
+
     def test_message_with_format_args(self):
         """Test log messages with formatting arguments are properly formatted."""
         formatter = StructuredFormatter()
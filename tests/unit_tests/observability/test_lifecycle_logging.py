@@ -4,6 +4,7 @@ import json
 import logging
 import uuid
 from io import StringIO
+from unittest.mock import patch
 
 import pytest
 
@@ -210,6 +211,19 @@ class TestLifecycleEvents:
 
         assert "total_execution_time" in obs.get_metrics_summary()
 
+    def test_execution_duration_ignores_wall_clock_jumps(self, observability_with_logger):
+        """Test that the crawl duration comes from the monotonic clock, not start_time."""
+        obs, _stream, _logger = observability_with_logger
+
+        with patch("glean.indexing.observability.observability.time") as mock_time:
+            mock_time.time.return_value = 1_000.0
+            mock_time.perf_counter.side_effect = [10.0, 10.5]
+            obs.start_execution()
+            mock_time.time.return_value = 0.0
+            obs.end_execution()
+
+        assert obs.get_metrics_summary()["total_execution_time"] == 0.5
+
     def test_end_execution_after_fail_execution_is_noop(self, observability_with_logger):
         """Test that calling end_execution after fail_execution emits no additional events."""
         obs, stream, _logger = observability_with_logger
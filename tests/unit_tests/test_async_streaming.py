@@ -1,5 +1,6 @@
 """Tests for async streaming base classes."""
 
+import contextvars
 import threading
 import time
 from typing import AsyncGenerator, Sequence
@@ -186,6 +187,49 @@ class TestBaseAsyncStreamingDatasourceConnector:
 
         assert max_active_uploads == 2
 
+    @pytest.mark.asyncio
+    async def test_index_data_async_transforms_off_event_loop(self):
+        """Test that transform runs on its own worker thread, not on the event loop."""
+        transform_threads = []
+
+        class RecordingConnector(DummyAsyncConnector):
+            def transform(self, data: Sequence[dict]) -> Sequence[DocumentDefinition]:
+                transform_threads.append(threading.current_thread())
+                return super().transform(data)
+
+        connector = RecordingConnector("test", DummyAsyncDataClient())
+        connector.batch_size = 2
+
+        with patch("glean.indexing.push.uploader.api_client"):
+            await connector.index_data_async()
+
+        assert len(transform_threads) == 3
+        assert len(set(transform_threads)) == 1
+        assert transform_threads[0] is not threading.current_thread()
+        assert transform_threads[0].name.startswith("test-transform")
+
+    @pytest.mark.asyncio
+    async def test_index_data_async_transform_sees_caller_context(self):
+        """Test that transform sees context variables set by the caller."""
+        request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+            "request_id", default=None
+        )
+        seen = []
+
+        class RecordingConnector(DummyAsyncConnector):
+            def transform(self, data: Sequence[dict]) -> Sequence[DocumentDefinition]:
+                seen.append(request_id.get())
+                return super().transform(data)
+
+        connector = RecordingConnector("test", DummyAsyncDataClient())
+        connector.batch_size = 2
+        request_id.set("abc")
+
+        with patch("glean.indexing.push.uploader.api_client"):
+            await connector.index_data_async()
+
+        assert seen == ["abc", "abc", "abc"]
+
     @pytest.mark.asyncio
     async def test_index_data_async_exact_batch_size_multiple(self):
         """Test that exact batch_size multiple correctly sets is_last_page=True."""
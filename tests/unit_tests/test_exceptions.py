@@ -13,6 +13,21 @@ from glean.indexing.exceptions import (
     UnsupportedConnectorTypeError,
 )
 
+MISSING_ENV_DOCS_URL = MissingEnvironmentVariableError.DOCS_URL
+INVALID_CONFIG_DOCS_URL = InvalidDatasourceConfigError.DOCS_URL
+
+# One instance of every SDK exception. The catch-all tests only inspect these,
+# never raise them, so they can be built once and shared.
+EXCEPTION_INSTANCES = (
+    GleanConfigurationError("test"),
+    MissingEnvironmentVariableError(["TEST"]),
+    InvalidDatasourceConfigError("field"),
+    GleanValidationError("test"),
+    InvalidPropertyError("field", "reason"),
+    InconsistentDataError("type", "details"),
+    UnsupportedConnectorTypeError(str, [int]),
+)
+
 
 class TestGleanError:
     """Tests for the base GleanError class."""
@@ -77,9 +92,10 @@ class TestMissingEnvironmentVariableError:
         """Test error message with a single missing variable."""
         error = MissingEnvironmentVariableError(["GLEAN_SERVER_URL"])
         assert error.missing_vars == ["GLEAN_SERVER_URL"]
-        assert "GLEAN_SERVER_URL" in str(error)
-        assert "export GLEAN_SERVER_URL=<value>" in str(error)
-        assert error.docs_url == MissingEnvironmentVariableError.DOCS_URL
+        message = str(error)
+        assert "GLEAN_SERVER_URL" in message
+        assert "export GLEAN_SERVER_URL=<value>" in message
+        assert error.docs_url == MISSING_ENV_DOCS_URL
 
     def test_multiple_missing_variables(self):
         """Test error message with multiple missing variables."""
@@ -105,9 +121,10 @@ class TestInvalidDatasourceConfigError:
         """Test error message for missing config field."""
         error = InvalidDatasourceConfigError("name")
         assert error.field_name == "name"
-        assert "name" in str(error)
-        assert "CustomDatasourceConfig" in str(error)
-        assert error.docs_url == InvalidDatasourceConfigError.DOCS_URL
+        message = str(error)
+        assert "name" in message
+        assert "CustomDatasourceConfig" in message
+        assert error.docs_url == INVALID_CONFIG_DOCS_URL
 
     def test_inherits_from_configuration_error(self):
         """Test inheritance hierarchy."""
@@ -139,8 +156,9 @@ class TestInvalidPropertyError:
         error = InvalidPropertyError("name", "cannot be empty")
         assert error.property_field == "name"
         assert error.reason == "cannot be empty"
-        assert "Invalid property 'name': cannot be empty" in str(error)
-        assert "Provide a valid value for 'name'" in str(error)
+        message = str(error)
+        assert "Invalid property 'name': cannot be empty" in message
+        assert "Provide a valid value for 'name'" in message
 
     def test_inherits_from_validation_error(self):
         """Test inheritance hierarchy."""
@@ -192,8 +210,9 @@ class TestUnsupportedConnectorTypeError:
         error = UnsupportedConnectorTypeError(FakeConnector, [SupportedConnector])
         assert error.connector_type == FakeConnector
         assert error.supported_types == [SupportedConnector]
-        assert "FakeConnector" in str(error)
-        assert "SupportedConnector" in str(error)
+        message = str(error)
+        assert "FakeConnector" in message
+        assert "SupportedConnector" in message
 
     def test_multiple_supported_types(self):
         """Test error message with multiple supported types."""
@@ -227,34 +246,10 @@ class TestUnsupportedConnectorTypeError:
 class TestExceptionHierarchyCatchAll:
     """Tests for catching all SDK exceptions with GleanError."""
 
-    def test_catch_all_with_glean_error(self):
-        """Test that all SDK exceptions can be caught with GleanError."""
-        exceptions = [
-            GleanConfigurationError("test"),
-            MissingEnvironmentVariableError(["TEST"]),
-            InvalidDatasourceConfigError("field"),
-            GleanValidationError("test"),
-            InvalidPropertyError("field", "reason"),
-            InconsistentDataError("type", "details"),
-            UnsupportedConnectorTypeError(str, [int]),
-        ]
-
-        for exc in exceptions:
-            with pytest.raises(GleanError):
-                raise exc
-
-    def test_backward_compatible_with_value_error(self):
-        """Test that all exceptions can still be caught as ValueError."""
-        exceptions = [
-            GleanConfigurationError("test"),
-            MissingEnvironmentVariableError(["TEST"]),
-            InvalidDatasourceConfigError("field"),
-            GleanValidationError("test"),
-            InvalidPropertyError("field", "reason"),
-            InconsistentDataError("type", "details"),
-            UnsupportedConnectorTypeError(str, [int]),
-        ]
-
-        for exc in exceptions:
-            with pytest.raises(ValueError):
-                raise exc
+    @pytest.mark.parametrize(
+        "error", EXCEPTION_INSTANCES, ids=[type(error).__name__ for error in EXCEPTION_INSTANCES]
+    )
+    def test_catch_all(self, error):
+        """Test that every SDK exception can be caught as GleanError and as ValueError."""
+        assert isinstance(error, GleanError)
+        assert isinstance(error, ValueError)
@@ -100,6 +100,29 @@ class TestRecordingDataClientWrapper:
         assert data["connector"] == "my_conn"
         assert data["client"] == "data_client"
 
+    def test_failed_rerecord_keeps_previous_fixture(self, tmp_path: Path):
+        def record(items: list) -> None:
+            RecordingDataClientWrapper(
+                inner=_FakeDataClient(items),
+                cache_dir=tmp_path,
+                connector_name="my_conn",
+                client_name="data_client",
+                sdk_version=_SDK_VER,
+            ).get_source_data()
+
+        record(_ITEMS)
+        with pytest.raises(TypeError):
+            record([*_ITEMS[:2], {"id": "bad", "value": object()}, *_ITEMS[3:]])
+
+        fixture_dir = tmp_path / "my_conn" / "integration" / "data_client"
+        lines = (fixture_dir / "data.ndjson").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == _ITEMS
+        assert json.loads((fixture_dir / "manifest.json").read_text())["item_count"] == 5
+        assert sorted(path.name for path in fixture_dir.iterdir()) == [
+            "data.ndjson",
+            "manifest.json",
+        ]
+
     def test_max_items_respected(self, tmp_path: Path):
         wrapper = RecordingDataClientWrapper(
             inner=_FakeDataClient(_ITEMS),
@@ -1,6 +1,7 @@
 """Tests for ReplayDataClientWrapper and its streaming siblings."""
 
 import json
+import math
 from pathlib import Path
 from typing import Any, AsyncGenerator, Generator, Sequence
 
@@ -73,6 +74,30 @@ class TestReplayDataClientWrapper:
         )
         assert list(replayer.get_source_data()) == _ITEMS
 
+    def test_record_then_replay_preserves_wide_ints_and_non_finite_floats(self, tmp_path: Path):
+        items = [{"id": "1", "big": 2**70, "nan": float("nan"), "inf": float("-inf")}]
+
+        class _Inner(BaseDataClient[dict]):
+            def get_source_data(self, **kwargs: Any) -> Sequence[dict]:
+                return list(items)
+
+        RecordingDataClientWrapper(
+            inner=_Inner(),
+            cache_dir=tmp_path,
+            connector_name="conn",
+            client_name="data_client",
+            sdk_version=_SDK_VER,
+        ).get_source_data()
+
+        replayer = ReplayDataClientWrapper(
+            cache_dir=tmp_path, connector_name="conn", client_name="data_client"
+        )
+        (replayed,) = replayer.get_source_data()
+        assert replayed["big"] == 2**70
+        assert isinstance(replayed["big"], int)
+        assert math.isnan(replayed["nan"])
+        assert replayed["inf"] == float("-inf")
+
     def test_missing_cache_raises(self, tmp_path: Path):
         wrapper = ReplayDataClientWrapper(
             cache_dir=tmp_path, connector_name="conn", client_name="missing"
@@ -131,6 +156,16 @@ class TestReplayStreamingClientWrapper:
         with pytest.raises(FileNotFoundError):
             list(wrapper.get_source_data())
 
+    def test_max_items_stops_before_unread_lines(self, tmp_path: Path):
+        """Lines past max_items are never parsed, so replay stays lazy."""
+        data_path = _write_fixture(tmp_path, "conn", "stream", _ITEMS[:2])
+        data_path.write_text(data_path.read_text() + "\nnot json")
+
+        wrapper = ReplayStreamingClientWrapper(
+            cache_dir=tmp_path, connector_name="conn", client_name="stream", max_items=2
+        )
+        assert list(wrapper.get_source_data()) == _ITEMS[:2]
+
 
 # ---------------------------------------------------------------------------
 # ReplayAsyncStreamingClientWrapper